@@ -2,12 +2,16 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import time
+import math
 import json
 import base64
 import io
 import os
 from datetime import datetime
 
+from cards import render_card_png, card_filename, find_photo
+from outbox import Outbox, FileTransport, HttpTransport
+
 # -----------------------------------------------------------------------------
 # 1. CONFIGURATION & STYLES
 # -----------------------------------------------------------------------------
@@ -106,9 +110,14 @@ TEAM_NAMES = [
 DEFAULT_CONFIG = {
     "purseLimit": 2500,
     "maxSquadSize": 35,
-    "basePrice": 10
+    "basePrice": 10,
+    "bidIncrement": 10,
+    "lotSeconds": 20
 }
 
+# Rows per page in the Teams tab roster viewer
+ROSTER_PAGE_SIZE = 15
+
 # Initial Data (Mock if no CSV loaded)
 INITIAL_PLAYERS = [
     {"ID": 1, "Name": "Ar. Abhishek Chandaliya", "Team": None, "Price": 0, "Cricket": "A", "Badminton": "B", "TT": "0", "CaptainFor": None},
@@ -134,53 +143,151 @@ if 'is_admin' not in st.session_state:
 if 'current_tab' not in st.session_state:
     st.session_state.current_tab = "Dashboard"
 
+# Live lot: the player on the block, its bids and the clock deadline
+if 'lot' not in st.session_state:
+    st.session_state.lot = {"pid": None, "bids": [], "opened": 0.0, "deadline": None}
+
+# Closed lots, in order: {"pid", "outcome", "bids": tuple of (team index, amount, ms since lot opened)}
+if 'bid_history' not in st.session_state:
+    st.session_state.bid_history = []
+
 # -----------------------------------------------------------------------------
 # 3. HELPER FUNCTIONS
 # -----------------------------------------------------------------------------
 
-def add_log(message, type="info"):
+def add_log(message, type="info", at=None):
     st.session_state.audit_log.insert(0, {
-        "timestamp": datetime.now().strftime("%H:%M:%S"),
+        "timestamp": (at or datetime.now()).strftime("%H:%M:%S"),
         "message": message,
         "type": type
     })
     # Keep log size manageable
     st.session_state.audit_log = st.session_state.audit_log[:50]
 
+@st.cache_resource
+def get_outbox():
+    # One background worker per server; set OUTBOX_URL to deliver over HTTP instead of the local file
+    url = os.environ.get("OUTBOX_URL")
+    transport = HttpTransport(url) if url else FileTransport("outbox.jsonl")
+    return Outbox(transport).start()
+
+def notify_player(pid, text, type="info"):
+    # Queues only; delivery happens on the outbox worker so handlers never wait
+    df = st.session_state.players
+    if 'Contact No' not in df.columns:
+        return
+    contact = df.loc[df['ID'] == pid, 'Contact No'].values[0]
+    if pd.isna(contact):
+        return
+    get_outbox().enqueue(str(contact).removesuffix(".0"), text, type)
+
+def sell_player(pid, team, price, at=None):
+    df = st.session_state.players
+    idx = df[df['ID'] == pid].index
+    df.loc[idx, 'Team'] = team
+    df.loc[idx, 'Price'] = price
+    
+    add_log(f"SOLD: {df.loc[idx, 'Name'].values[0]} to {team} for {price}", "sale", at)
+    notify_player(pid, f"Congratulations! You have been SOLD to {team} for ₹{price}.", "sale")
+    st.session_state['last_sold_id'] = pid
+
+def open_lot(pid):
+    lot = st.session_state.lot
+    if lot['pid'] == pid:
+        return lot
+    
+    # Previous player left the block without a sale
+    if lot['pid'] is not None:
+        archive_lot(lot, "PASSED")
+    
+    st.session_state.lot = {"pid": pid, "bids": [], "opened": time.time(), "deadline": None}
+    return st.session_state.lot
+
+def archive_lot(lot, outcome):
+    if lot['bids']:
+        st.session_state.bid_history.append({"pid": lot['pid'], "outcome": outcome, "bids": tuple(lot['bids'])})
+
+def close_lot(outcome):
+    archive_lot(st.session_state.lot, outcome)
+    st.session_state.lot = {"pid": None, "bids": [], "opened": 0.0, "deadline": None}
+    st.session_state['selected_player_id'] = None
+
+def close_expired_lot():
+    """
+    Hammer falls to the highest bidder once the clock has run out.
+    Called on every rerun, so a lot expires even while another tab is open.
+    """
+    lot = st.session_state.lot
+    if lot['deadline'] is None or not lot['bids'] or time.time() < lot['deadline']:
+        return False
+    
+    team_idx, amount, _ = lot['bids'][-1]
+    sell_player(lot['pid'], TEAM_NAMES[team_idx], amount, at=datetime.fromtimestamp(lot['deadline']))
+    close_lot("SOLD")
+    st.toast(f"⏱️ Clock ran out: lot sold to {TEAM_NAMES[team_idx]} for ₹{amount}")
+    return True
+
+def raise_bid(team_idx, amount):
+    # Button callback: runs before the fragment renders, so no explicit rerun is needed
+    lot = st.session_state.lot
+    if lot['bids'] and lot['bids'][-1][1] >= amount:
+        return # Stale click, the ladder has already moved on
+    
+    now = time.time()
+    lot['bids'].append((team_idx, amount, int((now - lot['opened']) * 1000)))
+    lot['deadline'] = now + st.session_state.config['lotSeconds']
+
+def undo_bid():
+    lot = st.session_state.lot
+    if lot['bids']:
+        lot['bids'].pop()
+    lot['deadline'] = time.time() + st.session_state.config['lotSeconds'] if lot['bids'] else None
+
+def get_bid_history_df():
+    names = st.session_state.players.set_index('ID')['Name']
+    rows = []
+    for lot_no, lot in enumerate(st.session_state.bid_history, start=1):
+        for team_idx, amount, ms in lot['bids']:
+            rows.append({
+                "Lot": lot_no,
+                "ID": lot['pid'],
+                "Name": names.get(lot['pid']),
+                "Outcome": lot['outcome'],
+                "Team": TEAM_NAMES[team_idx],
+                "Bid": amount,
+                "At (s)": ms / 1000
+            })
+    return pd.DataFrame(rows, columns=["Lot", "ID", "Name", "Outcome", "Team", "Bid", "At (s)"])
+
+@st.cache_data(max_entries=50)
+def get_sold_card(player):
+    return render_card_png(player)
+
 def calculate_team_stats():
     df = st.session_state.players
     config = st.session_state.config
-    stats = []
 
-    for team in TEAM_NAMES:
-        team_players = df[df['Team'] == team]
-        count = len(team_players)
-        spent = team_players['Price'].sum() if not team_players.empty else 0
-        
-        # Sport Counts
-        cricket = len(team_players[team_players['Cricket'].isin(['A','B','C'])])
-        badminton = len(team_players[team_players['Badminton'].isin(['A','B','C'])])
-        tt = len(team_players[team_players['TT'].isin(['A','B','C'])])
-        
-        # Financials
-        available = config['purseLimit'] - spent
-        empty_slots = max(0, config['maxSquadSize'] - count)
-        reserve = empty_slots * config['basePrice']
-        disposable = available - reserve
-
-        stats.append({
-            "Team": team,
-            "Spent": spent,
-            "Count": count,
-            "Slots": empty_slots,
-            "Purse": available,
-            "Disposable": disposable,
-            "Cricket": cricket,
-            "Badminton": badminton,
-            "TT": tt
-        })
-    
-    return pd.DataFrame(stats)
+    # One pass over the players: grade flags per sport, then a single groupby
+    sold = df[df['Team'].isin(TEAM_NAMES)]
+    graded = sold[['Cricket', 'Badminton', 'TT']].isin(['A','B','C'])
+    graded['Team'] = sold['Team']
+    graded['Price'] = sold['Price']
+    
+    stats = graded.groupby('Team').agg(
+        Spent=('Price', 'sum'),
+        Count=('Price', 'size'),
+        Cricket=('Cricket', 'sum'),
+        Badminton=('Badminton', 'sum'),
+        TT=('TT', 'sum')
+    ).reindex(TEAM_NAMES, fill_value=0)
+    
+    # Financials
+    stats['Slots'] = (config['maxSquadSize'] - stats['Count']).clip(lower=0)
+    stats['Purse'] = config['purseLimit'] - stats['Spent']
+    stats['Disposable'] = stats['Purse'] - stats['Slots'] * config['basePrice']
+    
+    stats = stats.rename_axis('Team').reset_index()
+    return stats[['Team', 'Spent', 'Count', 'Slots', 'Purse', 'Disposable', 'Cricket', 'Badminton', 'TT']]
 
 def get_developer_status():
     df = st.session_state.players
@@ -196,29 +303,6 @@ def get_developer_status():
         }
     return {"found": False}
 
-def get_player_image(player_name):
-    """
-    Finds the player image in the 'photos' directory.
-    Checks for .png, .jpg, .jpeg.
-    Returns path to image or default_player.png if not found.
-    """
-    base_path = "photos"
-    extensions = [".png", ".jpg", ".jpeg"]
-    
-    # Check for specific player image
-    for ext in extensions:
-        img_path = os.path.join(base_path, f"{player_name}{ext}")
-        if os.path.exists(img_path):
-            return img_path
-    
-    # Check for default fallback
-    default_path = os.path.join(base_path, "default_player.png")
-    if os.path.exists(default_path):
-        return default_path
-        
-    # If no default image exists, we return None (will handle in UI with a placeholder block)
-    return None
-
 # -----------------------------------------------------------------------------
 # 4. COMPONENT RENDERERS
 # -----------------------------------------------------------------------------
@@ -372,7 +456,7 @@ def render_auction_console():
             # HERO CARD WITH IMAGE
             # -----------------------------------------------------
             # Get Image Path
-            img_path = get_player_image(player['Name'])
+            img_path = find_photo(player['Name'])
             
             # Wrapper for styling
             st.markdown("""
@@ -424,44 +508,25 @@ def render_auction_console():
             # -----------------------------------------------------
             # BIDDING CONTROLS
             # -----------------------------------------------------
-            with st.container():
-                st.markdown("### 💰 Bidding")
-                
-                b_col1, b_col2 = st.columns(2)
-                with b_col1:
-                    winning_team = st.selectbox("Winning Team", TEAM_NAMES)
-                with b_col2:
-                    bid_amount = st.number_input("Winning Bid", min_value=0, value=config['basePrice'], step=10)
-                
-                # Validation Logic
-                team_stat = stats_df[stats_df['Team'] == winning_team].iloc[0]
-                
-                # Check 1: Full
-                is_full = team_stat['Count'] >= config['maxSquadSize']
-                
-                # Check 2: Budget
-                # Max Bid = Disposable + Base Price (since we are filling a slot, we use its reserve)
-                max_bid = team_stat['Disposable'] + config['basePrice']
-                can_afford = bid_amount <= max_bid
-
-                if is_full:
-                    st.error(f"❌ {winning_team} is FULL ({team_stat['Count']}/{config['maxSquadSize']})")
-                elif not can_afford:
-                    st.error(f"❌ Insufficient Funds. Max Bid: {max_bid}")
-                else:
-                    st.success(f"✅ Budget OK. Remaining after bid: {team_stat['Disposable'] + config['basePrice'] - bid_amount}")
-                    
-                    if st.button("🔨 SOLD", type="primary", use_container_width=True):
-                        # UPDATE DATAFRAME
-                        idx = df[df['ID'] == pid].index
-                        df.loc[idx, 'Team'] = winning_team
-                        df.loc[idx, 'Price'] = bid_amount
-                        
-                        add_log(f"SOLD: {player['Name']} to {winning_team} for {bid_amount}", "sale")
-                        
-                        st.balloons()
-                        time.sleep(1)
-                        st.rerun()
+            open_lot(int(pid))
+            render_bid_ladder(stats_df)
+
+    # -------------------------------------------------------------------------
+    # SOLD CARD (last sale)
+    # -------------------------------------------------------------------------
+    last_sold = df[(df['ID'] == st.session_state.get('last_sold_id')) & df['Team'].notna()]
+    if not last_sold.empty:
+        sold_player = last_sold.iloc[0][['ID', 'Name', 'Team', 'Price', 'Cricket', 'Badminton', 'TT']].to_dict()
+        with st.expander(f"📸 SOLD Card: {sold_player['Name']}", expanded=True):
+            card_png = get_sold_card(sold_player)
+            st.image(card_png, use_container_width=True)
+            st.download_button(
+                "Download Card (PNG)",
+                card_png,
+                card_filename(sold_player),
+                "image/png",
+                key='download-card'
+            )
 
     # -------------------------------------------------------------------------
     # CORRECTION MANAGER
@@ -505,6 +570,7 @@ def render_auction_console():
                     idx = df[df['ID'] == target_id].index
                     df.loc[idx, ['Team', 'Price']] = [new_team, new_price]
                     add_log(f"CORRECTION: {target_player['Name']} updated to {new_team} @ {new_price}", "correction")
+                    notify_player(target_id, f"Your sale has been updated: {new_team} for ₹{new_price}.", "sale")
                     st.success("Updated!")
                     time.sleep(0.5)
                     st.rerun()
@@ -526,45 +592,132 @@ def render_auction_console():
                     df.loc[idx, 'CaptainFor'] = None # Also remove captaincy if reverted
                     
                     add_log(f"REVERT: {target_player['Name']} removed from {prev_team}", "revert")
+                    notify_player(target_id, f"Your sale to {prev_team} has been reverted. You are back in the auction pool.", "revert")
                     
                     st.success(f"Player {target_player['Name']} is now Unsold!")
                     time.sleep(0.5)
                     st.rerun()
 
+@st.fragment(run_every=1)
+def render_bid_ladder(stats_df):
+    # Runs as a fragment: raises and clock ticks rerun only this block
+    config = st.session_state.config
+    lot = st.session_state.lot
+    bids = lot['bids']
+    
+    st.markdown("### 💰 Bidding")
+    
+    # Auto-close: reruns the whole app so the sale shows everywhere
+    if close_expired_lot():
+        st.rerun()
+    
+    # Clock (starts on the first bid, resets on every raise)
+    remaining = None
+    if lot['deadline'] is not None:
+        remaining = max(0, math.ceil(lot['deadline'] - time.time()))
+    
+    if bids:
+        top_team, top_amount = TEAM_NAMES[bids[-1][0]], bids[-1][1]
+        next_bid = top_amount + config['bidIncrement']
+    else:
+        top_team, top_amount = None, 0
+        next_bid = config['basePrice']
+    
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Current Bid", f"₹{top_amount}" if top_team else "-", top_team or "No Bids")
+    m2.metric("Next Bid", f"₹{next_bid}")
+    m3.metric("⏱️ Clock", f"{remaining}s" if remaining is not None else f"{config['lotSeconds']}s")
+    
+    # Raise Ladder
+    st.markdown("#### Raise")
+    cols = st.columns(3)
+    for i, team in enumerate(TEAM_NAMES):
+        team_stat = stats_df[stats_df['Team'] == team].iloc[0]
+        
+        # Max Bid = Disposable + Base Price (since we are filling a slot, we use its reserve)
+        is_full = team_stat['Count'] >= config['maxSquadSize']
+        max_bid = team_stat['Disposable'] + config['basePrice']
+        disabled = is_full or next_bid > max_bid or team == top_team
+        
+        with cols[i % 3]:
+            st.button(f"{team} ₹{next_bid}", key=f"raise_{i}", disabled=disabled, use_container_width=True,
+                      help="Squad full" if is_full else f"Max Bid: {max_bid}",
+                      on_click=raise_bid, args=(i, next_bid))
+    
+    # Manual Controls
+    a_col1, a_col2 = st.columns(2)
+    with a_col1:
+        if st.button("🔨 SOLD", type="primary", use_container_width=True, disabled=not top_team):
+            sell_player(lot['pid'], top_team, top_amount)
+            close_lot("SOLD")
+            
+            st.balloons()
+            time.sleep(1)
+            st.rerun()
+    with a_col2:
+        st.button("↩️ Undo Last Bid", use_container_width=True, disabled=not bids, on_click=undo_bid)
+    
+    # Bid History (latest first)
+    if bids:
+        history_df = pd.DataFrame(
+            [(TEAM_NAMES[t], amount, f"{ms / 1000:.1f}s") for t, amount, ms in reversed(bids)],
+            columns=['Team', 'Bid (₹)', 'At']
+        )
+        st.dataframe(history_df, use_container_width=True, hide_index=True, height=200)
+
 def render_teams():
     st.title("👥 Teams & Rosters")
     
     stats_df = calculate_team_stats()
     df = st.session_state.players
+    config = st.session_state.config
     
-    for _, team_stat in stats_df.iterrows():
-        team_name = team_stat['Team']
-        
-        # Attention Logic
-        attention_needed = False
-        border_color = "#334155"
-        
-        if team_stat['Cricket'] < 6: attention_needed = True
-        
-        with st.expander(f"{team_name} (Sold: {team_stat['Count']}/{st.session_state.config['maxSquadSize']}) - Purse: ₹{team_stat['Disposable']}", expanded=False):
-            
-            # Stats Grid
-            c1, c2, c3, c4 = st.columns(4)
-            c1.metric("Spent", f"₹{team_stat['Spent']}")
-            c2.metric("Cricket", team_stat['Cricket'])
-            c3.metric("Badminton", team_stat['Badminton'])
-            c4.metric("TT", team_stat['TT'])
-            
-            # Roster Table
-            team_roster = df[df['Team'] == team_name].copy()
-            if not team_roster.empty:
-                st.dataframe(
-                    team_roster[['Name', 'Price', 'Cricket', 'Badminton', 'TT', 'CaptainFor']],
-                    use_container_width=True,
-                    hide_index=True
-                )
-            else:
-                st.info("No players yet.")
+    # 1. Compact Summary (one table for all teams, no per-team widgets)
+    summary_df = stats_df[['Team', 'Count', 'Spent', 'Disposable', 'Cricket', 'Badminton', 'TT']].copy()
+    summary_df['Attention'] = np.where(stats_df['Cricket'] < 6, "⚠️", "")
+    summary_df.columns = ['Team', f"Sold (of {config['maxSquadSize']})", 'Spent (₹)', 'Purse Left (₹)', '🏏 Cricket', '🏸 Badminton', '🏓 TT', 'Attention']
+    
+    st.dataframe(
+        summary_df,
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    st.markdown("---")
+    
+    # 2. Roster Viewer (only the selected team is materialized)
+    team_name = st.selectbox("View Roster", [""] + TEAM_NAMES, key="roster_team")
+    if not team_name:
+        st.info("Select a team to view its roster.")
+        return
+    
+    team_stat = stats_df[stats_df['Team'] == team_name].iloc[0]
+    
+    # Stats Grid
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Spent", f"₹{team_stat['Spent']}")
+    c2.metric("Cricket", team_stat['Cricket'])
+    c3.metric("Badminton", team_stat['Badminton'])
+    c4.metric("TT", team_stat['TT'])
+    
+    # Roster Table
+    team_roster = df[df['Team'] == team_name]
+    if team_roster.empty:
+        st.info("No players yet.")
+        return
+    
+    # Paging keeps large squads cheap to send
+    total_pages = max(1, -(-len(team_roster) // ROSTER_PAGE_SIZE))
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, step=1, key=f"roster_page_{team_name}")
+    
+    start = (page - 1) * ROSTER_PAGE_SIZE
+    st.dataframe(
+        team_roster.iloc[start:start + ROSTER_PAGE_SIZE][['Name', 'Price', 'Cricket', 'Badminton', 'TT', 'CaptainFor']],
+        use_container_width=True,
+        hide_index=True
+    )
 
 def render_settings():
     st.title("⚙️ Settings & Admin")
@@ -588,19 +741,23 @@ def render_settings():
         st.session_state.is_admin = False
         st.rerun()
     
-    tab1, tab2, tab3 = st.tabs(["Tournament Config", "Data Management", "Captains"])
+    tab1, tab2, tab3, tab4 = st.tabs(["Tournament Config", "Data Management", "Captains", "Notifications"])
     
     with tab1:
         st.subheader("Rules")
         c_purse = st.number_input("Purse Limit", value=st.session_state.config['purseLimit'])
         c_squad = st.number_input("Max Squad", value=st.session_state.config['maxSquadSize'])
         c_base = st.number_input("Base Price", value=st.session_state.config['basePrice'])
+        c_increment = st.number_input("Bid Increment", min_value=1, value=st.session_state.config['bidIncrement'])
+        c_lot = st.number_input("Lot Clock (seconds)", min_value=5, value=st.session_state.config['lotSeconds'])
         
         if st.button("Save Config"):
             st.session_state.config = {
                 "purseLimit": c_purse,
                 "maxSquadSize": c_squad,
-                "basePrice": c_base
+                "basePrice": c_base,
+                "bidIncrement": c_increment,
+                "lotSeconds": c_lot
             }
             st.success("Configuration Saved!")
 
@@ -617,14 +774,33 @@ def render_settings():
             key='download-csv'
         )
         
+        # Bid history: one row per bid, grouped by lot
+        history_df = get_bid_history_df()
+        st.download_button(
+            "Download Bid History (CSV)",
+            history_df.to_csv(index=False).encode('utf-8'),
+            "bid_history.csv",
+            "text/csv",
+            key='download-bid-history'
+        )
+        if not history_df.empty:
+            st.dataframe(history_df, use_container_width=True, hide_index=True, height=250)
+        
         st.subheader("Import Data")
         uploaded_file = st.file_uploader("Upload CSV", type=['csv'])
         if uploaded_file is not None:
             try:
                 new_df = pd.read_csv(uploaded_file)
+                
+                # Master Player.csv uses 'Player Name ' (trailing space) for the name column
+                new_df.columns = new_df.columns.str.strip()
+                new_df = new_df.rename(columns={'Player Name': 'Name'})
+                
                 # Basic validation
                 req_cols = ['Name', 'Cricket', 'Badminton', 'TT']
                 if all(col in new_df.columns for col in req_cols):
+                    new_df['Name'] = new_df['Name'].astype(str).str.strip()
+                    
                     # Ensure ID column
                     if 'ID' not in new_df.columns:
                         new_df['ID'] = range(1, len(new_df) + 1)
@@ -676,14 +852,46 @@ def render_settings():
                 df.loc[idx, 'CaptainFor'] = cap_sport
                 
                 add_log(f"CAPTAIN: {df.loc[idx, 'Name'].values[0]} assigned to {cap_team}", "captain")
+                notify_player(pid, f"You have been named {cap_sport} captain of {cap_team}.", "captain")
                 st.success("Captain Assigned!")
                 st.rerun()
 
+    with tab4:
+        st.subheader("Player Notifications")
+        outbox = get_outbox()
+        
+        n1, n2, n3 = st.columns(3)
+        n1.metric("Sent", outbox.sent)
+        n2.metric("Pending", outbox.pending())
+        n3.metric("Failed", len(outbox.failed))
+        
+        # Messages that exhausted every retry never reached the player
+        if outbox.failed:
+            st.error(f"❌ {len(outbox.failed)} notification(s) could not be delivered.")
+            st.dataframe(pd.DataFrame(list(outbox.failed)), use_container_width=True, hide_index=True)
+        
+        r_col1, r_col2, r_col3 = st.columns(3)
+        with r_col1:
+            if st.button("🔁 Retry Failed", disabled=not outbox.failed, use_container_width=True):
+                count = outbox.retry_failed()
+                add_log(f"NOTIFY: re-queued {count} failed notification(s)", "info")
+                st.rerun()
+        with r_col2:
+            if st.button("🗑️ Clear Failed", disabled=not outbox.failed, use_container_width=True):
+                outbox.clear_failed()
+                st.rerun()
+        with r_col3:
+            if st.button("Refresh", use_container_width=True):
+                st.rerun()
+
 # -----------------------------------------------------------------------------
 # 5. MAIN LAYOUT
 # -----------------------------------------------------------------------------
 
 def main():
+    # A running lot may have expired while the Console was not on screen
+    close_expired_lot()
+    
     # Sidebar Navigation
     with st.sidebar:
         st.title("🏆 Navigation")
@@ -709,6 +917,10 @@ def main():
             if log['type'] == 'revert': icon = "❌"
             if log['type'] == 'captain': icon = "👑"
             st.markdown(f"<div style='font-size:12px; border-bottom:1px solid #333; padding:5px;'>{icon} {log['message']}</div>", unsafe_allow_html=True)
+        
+        # Undelivered notifications (details in Settings > Notifications)
+        if st.session_state.is_admin and get_outbox().failed:
+            st.warning(f"⚠️ {len(get_outbox().failed)} player notification(s) failed.")
 
     # Main Content Area
     tab = st.session_state.current_tab
@@ -0,0 +1,192 @@
+import os
+import io
+import re
+import sys
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+# -----------------------------------------------------------------------------
+# 1. CONSTANTS
+# -----------------------------------------------------------------------------
+
+PHOTOS_DIR = "Photos"
+PHOTO_EXTENSIONS = [".png", ".jpg", ".jpeg"]
+
+CARD_SIZE = (1200, 630)
+PHOTO_SIZE = (380, 380)
+
+# Decoded photos kept per process (~430 KB each). Batch jobs are sorted by photo,
+# so a worker only revisits the last few; the app shows one card at a time.
+PHOTO_CACHE_SIZE = 16
+
+# Fast zlib level: PNG encoding dominates batch time, not drawing
+PNG_COMPRESS_LEVEL = 1
+
+# Colours mirror the Auction Console hero card
+BG_COLOR = "#020617"      # Slate-950
+CARD_COLOR = "#0f172a"    # Slate-900
+BORDER_COLOR = "#6366f1"  # Indigo-500
+MUTED_COLOR = "#64748b"   # Slate-500
+SOLD_COLOR = "#10b981"    # Emerald-500
+
+# (label, column, background, border, text) as in the hero sports badges
+BADGES = [
+    ("CRICKET", "Cricket", "#1e3a8a", "#3b82f6", "#f59e0b"),
+    ("BADMINTON", "Badminton", "#064e3b", "#10b981", "#10b981"),
+    ("TT", "TT", "#431407", "#f97316", "#3b82f6"),
+]
+
+# -----------------------------------------------------------------------------
+# 2. HELPER FUNCTIONS
+# -----------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def get_font(size, bold=False, mono=False):
+    name = "DejaVuSansMono" if mono else "DejaVuSans"
+    if bold:
+        name += "-Bold"
+    try:
+        return ImageFont.truetype(f"{name}.ttf", size)
+    except OSError:
+        return ImageFont.load_default(size=size)
+
+def fit_text(draw, text, max_width, size, min_size=28, bold=True):
+    """
+    Returns (text, font) that fits `max_width`: shrinks the font down to `min_size`,
+    then truncates with an ellipsis.
+    """
+    while size > min_size and draw.textlength(text, font=get_font(size, bold=bold)) > max_width:
+        size -= 2
+    font = get_font(size, bold=bold)
+
+    if draw.textlength(text, font=font) > max_width:
+        while text and draw.textlength(text + "…", font=font) > max_width:
+            text = text[:-1]
+        text = text.rstrip() + "…"
+    return text, font
+
+def find_photo(player_name):
+    """
+    Finds the player photo in the 'Photos' directory.
+    Returns the path, default_player.png, or None if neither exists.
+    """
+    for ext in PHOTO_EXTENSIONS:
+        img_path = os.path.join(PHOTOS_DIR, f"{player_name}{ext}")
+        if os.path.exists(img_path):
+            return img_path
+
+    default_path = os.path.join(PHOTOS_DIR, "default_player.png")
+    if os.path.exists(default_path):
+        return default_path
+
+    return None
+
+@lru_cache(maxsize=PHOTO_CACHE_SIZE)
+def load_photo(path, size=PHOTO_SIZE):
+    """
+    Decodes and crops a photo to `size` once per process.
+    The returned image is shared; callers must only paste it, never mutate it.
+    """
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img).convert("RGB")
+        return ImageOps.fit(img, size, Image.LANCZOS)
+
+# -----------------------------------------------------------------------------
+# 3. CARD RENDERER
+# -----------------------------------------------------------------------------
+
+def render_card(player):
+    """Draws the SOLD card for a player record (dict with the players columns)."""
+    card = Image.new("RGB", CARD_SIZE, BG_COLOR)
+    draw = ImageDraw.Draw(card)
+    width, height = CARD_SIZE
+
+    # Hero container
+    draw.rounded_rectangle([20, 20, width - 20, height - 20], radius=16, fill=CARD_COLOR, outline=BORDER_COLOR, width=4)
+
+    # Photo (or the placeholder block used in the console)
+    px, py = 60, (height - PHOTO_SIZE[1]) // 2
+    photo_path = find_photo(player['Name'])
+    if photo_path:
+        card.paste(load_photo(photo_path), (px, py))
+        draw.rounded_rectangle([px, py, px + PHOTO_SIZE[0], py + PHOTO_SIZE[1]], radius=12, outline="#334155", width=3)
+    else:
+        draw.rounded_rectangle([px, py, px + PHOTO_SIZE[0], py + PHOTO_SIZE[1]], radius=12, fill="#1e293b", outline="#475569", width=3)
+
+    # Details
+    tx = px + PHOTO_SIZE[0] + 50
+    text_width = width - 40 - tx
+    name, name_font = fit_text(draw, str(player['Name']), text_width, 56)
+    draw.text((tx, 70), name, font=name_font, fill="#ffffff")
+    draw.text((tx, 145), f"PLAYER ID: #{player['ID']}", font=get_font(24, mono=True), fill=MUTED_COLOR)
+
+    # Sports Badges
+    bx, by = tx, 200
+    badge_font = get_font(22, bold=True)
+    for label, col, bg, border, text_color in BADGES:
+        text = f"{label}: {player[col]}"
+        text_w = draw.textlength(text, font=badge_font)
+        draw.rounded_rectangle([bx, by, bx + text_w + 40, by + 44], radius=22, fill=bg, outline=border, width=2)
+        draw.text((bx + 20, by + 9), text, font=badge_font, fill=text_color)
+        bx += text_w + 60
+
+    # Sale
+    draw.text((tx, 300), "SOLD", font=get_font(96, bold=True), fill=SOLD_COLOR)
+    team, team_font = fit_text(draw, str(player['Team']), text_width, 40)
+    draw.text((tx, 420), team, font=team_font, fill="#f8fafc")
+    draw.text((tx, 475), f"₹{int(player['Price'])}", font=get_font(48, bold=True), fill="#f59e0b")
+
+    return card
+
+def render_card_png(player):
+    buf = io.BytesIO()
+    render_card(player).save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buf.getvalue()
+
+def card_filename(player):
+    safe_name = re.sub(r"[^\w\-]+", "_", str(player['Name'])).strip("_")
+    return f"{player['ID']}_{safe_name}.png"
+
+def _render_to_file(job):
+    player, out_path = job
+    render_card(player).save(out_path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return out_path
+
+def render_sold_cards(players_df, out_dir, workers=None):
+    """
+    Writes a PNG card for every sold player using a process pool.
+    Returns the list of written paths.
+    """
+    sold = players_df[players_df['Team'].notna()]
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Group by photo so a worker's chunk reuses its cached decodes
+    records = sorted(sold.to_dict('records'), key=lambda p: find_photo(p['Name']) or "")
+    jobs = [(p, os.path.join(out_dir, card_filename(p))) for p in records]
+    if not jobs:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_to_file, jobs, chunksize=chunksize))
+
+# -----------------------------------------------------------------------------
+# 4. COMMAND LINE
+# -----------------------------------------------------------------------------
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python cards.py <auction_data.csv> [output_dir]")
+        sys.exit(1)
+
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else "cards"
+    players_df = pd.read_csv(sys.argv[1])
+    paths = render_sold_cards(players_df, out_dir)
+    print(f"Wrote {len(paths)} cards to {out_dir}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
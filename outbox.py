@@ -0,0 +1,136 @@
+import json
+import asyncio
+import threading
+import urllib.request
+from collections import deque
+from datetime import datetime
+
+# -----------------------------------------------------------------------------
+# 1. TRANSPORTS
+# -----------------------------------------------------------------------------
+
+class FileTransport:
+    """Local stub: appends each message as a JSON line to `path`."""
+
+    def __init__(self, path="outbox.jsonl"):
+        self.path = path
+
+    def _write(self, batch):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for msg in batch:
+                f.write(json.dumps(msg) + "\n")
+
+    async def send(self, batch):
+        await asyncio.to_thread(self._write, batch)
+
+class HttpTransport:
+    """POSTs each batch as {"messages": [...]} to `url`; non-2xx raises."""
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def _post(self, batch):
+        body = json.dumps({"messages": batch}).encode("utf-8")
+        req = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=self.timeout):
+            pass
+
+    async def send(self, batch):
+        await asyncio.to_thread(self._post, batch)
+
+# -----------------------------------------------------------------------------
+# 2. OUTBOX
+# -----------------------------------------------------------------------------
+
+class Outbox:
+    """
+    Queues player notifications and delivers them from a background asyncio loop.
+    `enqueue` never blocks; batching, rate limiting and retries happen on the worker.
+    """
+
+    def __init__(self, transport, batch_size=20, rate_per_sec=5, max_retries=3, backoff=1.0):
+        self.transport = transport
+        self.batch_size = batch_size
+        self.rate_per_sec = rate_per_sec
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        self.sent = 0
+        self.failed = deque(maxlen=200)
+        self._in_flight = 0
+
+        self._loop = None
+        self._queue = None
+        self._ready = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name="outbox", daemon=True)
+        thread.start()
+        self._ready.wait()
+        return self
+
+    def enqueue(self, to, text, type="info"):
+        msg = {
+            "to": to,
+            "text": text,
+            "type": type,
+            "queued_at": datetime.now().isoformat(timespec="seconds")
+        }
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, msg)
+
+    def pending(self):
+        # Queued plus the batch currently being sent or backing off
+        return (self._queue.qsize() if self._queue else 0) + self._in_flight
+
+    def retry_failed(self):
+        """Re-queues every failed message; returns how many were re-queued."""
+        count = 0
+        while self.failed:
+            msg = self.failed.popleft()
+            msg.pop("error", None)
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, msg)
+            count += 1
+        return count
+
+    def clear_failed(self):
+        self.failed.clear()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        self._ready.set()
+        self._loop.run_until_complete(self._worker())
+
+    async def _worker(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            await self._deliver(batch)
+
+            # Rate limit: space batches so throughput stays under rate_per_sec
+            await asyncio.sleep(len(batch) / self.rate_per_sec)
+
+    async def _deliver(self, batch):
+        self._in_flight = len(batch)
+        try:
+            await self._send_with_retries(batch)
+        finally:
+            self._in_flight = 0
+
+    async def _send_with_retries(self, batch):
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.transport.send(batch)
+                self.sent += len(batch)
+                return
+            except Exception as e:
+                error = str(e)
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.backoff * 2 ** attempt)
+
+        for msg in batch:
+            self.failed.append({**msg, "error": error})
\ No newline at end of file